@@ -1,6 +1,7 @@
 import os
 import zipfile
-import pydicom
+import importlib
+import importlib.util
 import numpy as np
 from PIL import Image, ImageTk, ImageOps
 from pathlib import Path
@@ -9,112 +10,592 @@ from tkinter import ttk, filedialog, messagebox
 import shutil
 from datetime import datetime
 import threading
+import multiprocessing
+import atexit
+from functools import lru_cache
+from collections import defaultdict
+from io import BytesIO
+import queue
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import tempfile
 import sys
 import subprocess
-import imageio
+import struct
+import time
 import numpy as np
 from tkinter import messagebox, filedialog
 from PIL import Image
-try:
-    import cv2
-    OPENCV_AVAILABLE = True
-except ImportError:
-    OPENCV_AVAILABLE = False
 
-def extract_zip(zip_path, extract_to):
-    """Extract zip file to specified directory"""
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
-    return extract_to
+class _LazyModule:
+    """Stand-in for a slow-to-import module, imported on first attribute access"""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
 
-def find_dicom_files(folder_path):
-    """Recursively find DICOM files in the given folder"""
-    dicom_files = []
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            file_path = os.path.join(root, file)
+# cv2, pydicom and imageio take a good part of a second to import, so they are
+# only loaded when an image is first processed
+pydicom = _LazyModule('pydicom')
+cv2 = _LazyModule('cv2')
+imageio = _LazyModule('imageio')
+
+@lru_cache(maxsize=None)
+def _opencv_available():
+    """Return True if OpenCV can be imported, trying the import only once"""
+    # An installed cv2 can still fail to load (e.g. a missing libGL), so
+    # finding the package is not enough; fall back to NumPy/PIL then
+    try:
+        importlib.import_module('cv2')
+        return True
+    except ImportError:
+        return False
+# pydicom picks up the pylibjpeg decoding plugins on its own when installed
+HAS_PYLIBJPEG = importlib.util.find_spec('pylibjpeg') is not None
+
+@lru_cache(maxsize=None)
+def _get_decoder_factory():
+    """Return pydicom's get_decoder, or None for pydicom < 3.0"""
+    try:
+        # pydicom >= 3.0 lets us pick the decoding plugin per call
+        from pydicom.pixels import get_decoder
+        return get_decoder
+    except ImportError:
+        pass
+    
+    if HAS_PYLIBJPEG:
+        # Older pydicom tries its handlers in list order; put pylibjpeg ahead of Pillow
+        try:
+            from pydicom.pixel_data_handlers import pylibjpeg_handler
+            pydicom.config.pixel_data_handlers.remove(pylibjpeg_handler)
+            pydicom.config.pixel_data_handlers.insert(0, pylibjpeg_handler)
+        except (ImportError, AttributeError, ValueError):
+            pass
+    return None
+
+# Decoding plugins for compressed pixel data, fastest first (pydicom's default
+# choice depends on import order and can leave us on the slow Pillow path)
+PIXEL_DECODER_PLUGINS = ('pylibjpeg', 'gdcm', 'pillow')
+
+def extract_dicom_from_zip(zip_path, extract_to):
+    """Extract only the DICOM members of a zip file and return their paths"""
+    extracted = []
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
             try:
-                # Check if file is a DICOM file by reading the first 132 bytes
-                with open(file_path, 'rb') as f:
-                    content = f.read(132)  # Read first 132 bytes to check DICOM signature
-                    if is_dicom_file_content(content):
-                        dicom_files.append(file_path)
+                # Sniff the header straight from the archive before writing anything
+                if is_dicom_file_content(read_zip_member_head(zf, info)):
+                    extracted.append(zf.extract(info, extract_to))
             except Exception as e:
-                print(f"Error checking {file_path}: {e}")
-    return dicom_files
+                print(f"  Warning: Could not extract {info.filename}: {str(e)}")
+    return extracted
+
+# zlib level for PNG output: 1 encodes roughly twice as fast as the default
+# for a ~10% larger file, which is the right trade for extracted frames
+PNG_COMPRESSION = 1
+
+# File extensions that are accepted as DICOM without sniffing the header.
+# A tuple for str.endswith: faster in CPython than splitext + a set lookup
+DICOM_EXTENSIONS = ('.dcm', '.dicom', '.ima')
+
+# Extensions accepted as input without opening the file
+CANDIDATE_EXTENSIONS = ('.zip',) + DICOM_EXTENSIONS
+
+# Header sniffing is I/O-bound, so oversubscribe the CPU count
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _walk_scandir(path):
+    """Recursively yield DirEntry objects for all files under path"""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_scandir(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError as e:
+        print(f"Error scanning {path}: {e}")
+
+# Input dtypes accepted by cv2.convertScaleAbs
+_CV2_SCALE_DTYPES = frozenset(np.dtype(t) for t in (
+    np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64))
+
+def _scale_to_uint8_cv2(pixel_array, alpha, beta):
+    """Compute saturate(pixel_array * alpha + beta) as uint8 in one OpenCV pass"""
+    # OpenCV treats a trailing axis as channels, so flatten volumes to 2D
+    flat = pixel_array.reshape(pixel_array.shape[0], -1) if pixel_array.ndim > 2 else pixel_array
+    return cv2.convertScaleAbs(flat, alpha=float(alpha), beta=float(beta)).reshape(pixel_array.shape)
+
+def _scale_to_uint8_numpy(pixel_array, alpha, beta):
+    """Compute saturate(pixel_array * alpha + beta) as uint8 with NumPy (float32)"""
+    buf = np.empty(pixel_array.shape, dtype=np.float32)
+    np.multiply(pixel_array, np.float32(alpha), out=buf, casting='unsafe')
+    buf += np.float32(beta + 0.5)  # Round like OpenCV's saturate_cast rather than truncate
+    np.clip(buf, 0, 255, out=buf)
+    return buf.astype(np.uint8)
+
+@lru_cache(maxsize=None)
+def _make_normalizer(dtype_str, photometric, per_frame=False):
+    """Build a pixel_array -> uint8 normalizer specialized for one dtype and photometric.
+    
+    A series is usually hundreds of frames with the same dtype and photometric
+    interpretation, so the dtype checks, backend choice and MONOCHROME1 branch
+    are resolved once here instead of on every frame. With per_frame, axis 0
+    indexes frames and each frame gets its own window.
+    """
+    dtype = np.dtype(dtype_str)
+    cast = dtype.type
+    round_bounds = np.issubdtype(dtype, np.integer)
+    
+    if per_frame:
+        return _make_frame_normalizer(dtype, photometric == 'MONOCHROME1', round_bounds)
+    to_uint8 = (_scale_to_uint8_cv2 if _opencv_available() and dtype in _CV2_SCALE_DTYPES
+                else _scale_to_uint8_numpy)
+    
+    if photometric == 'MONOCHROME1':
+        # Invert grayscale by swapping the roles of min and max
+        def coefficients(lo, hi, scale):
+            return -scale, hi * scale
+        def flat_image(pixel_array):
+            return np.zeros(pixel_array.shape, dtype=np.uint8)
+    else:
+        def coefficients(lo, hi, scale):
+            return scale, -lo * scale
+        def flat_image(pixel_array):
+            return np.clip(pixel_array, 0, 255).astype(np.uint8)
+    
+    def normalize(pixel_array):
+        # Use the 2nd/98th percentiles so a few bright outliers (markers,
+        # hot pixels) don't compress the rest of the image into darkness
+        lo, hi = (float(v) for v in np.percentile(pixel_array, (2, 98)))
+        if hi <= lo:
+            # Sparse images (masks, a small ROI on black) put both percentiles
+            # on the background value; window on the full range instead
+            lo, hi = float(pixel_array.min()), float(pixel_array.max())
+        if round_bounds:
+            lo, hi = float(np.floor(lo)), float(np.ceil(hi))
+        pixel_array = np.clip(pixel_array, cast(lo), cast(hi))
+        
+        if hi > lo:  # Avoid division by zero
+            scale = np.float32(255.0 / (hi - lo))
+            return to_uint8(pixel_array, *coefficients(lo, hi, scale))
+        return flat_image(pixel_array)
+    
+    return normalize
+
+def _make_frame_normalizer(dtype, invert, round_bounds):
+    """Build a normalizer that windows each frame of a volume independently"""
+    def normalize(pixel_array):
+        # Per-frame 2nd/98th percentiles, shaped (frames, 1, 1...) to broadcast
+        frame_axes = tuple(range(1, pixel_array.ndim))
+        lo, hi = np.percentile(pixel_array, (2, 98), axis=frame_axes, keepdims=True)
+        collapsed = hi <= lo
+        if collapsed.any():
+            # Sparse frames put both percentiles on the background value;
+            # window those on their full range instead
+            lo = np.where(collapsed, pixel_array.min(axis=frame_axes, keepdims=True), lo)
+            hi = np.where(collapsed, pixel_array.max(axis=frame_axes, keepdims=True), hi)
+        if round_bounds:
+            lo, hi = np.floor(lo), np.ceil(hi)
+        pixel_array = np.clip(pixel_array, lo.astype(dtype), hi.astype(dtype))
+        
+        # Flat frames (hi == lo) get a zero scale here and are filled in below
+        span = hi - lo
+        scale = np.divide(255.0, span, out=np.zeros_like(span), where=span > 0).astype(np.float32)
+        
+        # One broadcast subtract and multiply over the whole volume
+        if invert:
+            buf = np.subtract(hi.astype(np.float32), pixel_array, dtype=np.float32)
+        else:
+            buf = np.subtract(pixel_array, lo.astype(np.float32), dtype=np.float32)
+        buf *= scale
+        buf += np.float32(0.5)  # Round rather than truncate
+        np.clip(buf, 0, 255, out=buf)
+        image = buf.astype(np.uint8)
+        
+        # Constant frames match the single-frame normalizer's flat image
+        flat = (span <= 0).reshape(-1)
+        if flat.any():
+            image[flat] = 0 if invert else np.clip(pixel_array[flat], 0, 255)
+        return image
+    
+    return normalize
 
-def process_dicom(dicom_path):
-    """Process a single DICOM file and return image data"""
+def get_pixel_data(ds, index=None):
+    """Return the pixel array of ds, decoding with the fastest available plugin.
+    
+    If index is given for a multi-frame dataset only that frame is decoded;
+    pydicom reads just its fragments and leaves the other frames untouched.
+    """
+    if int(getattr(ds, 'NumberOfFrames', 1) or 1) <= 1:
+        index = None
+    
+    get_decoder = _get_decoder_factory()
+    transfer_syntax = getattr(getattr(ds, 'file_meta', None), 'TransferSyntaxUID', None)
+    if (get_decoder is not None and transfer_syntax is not None and transfer_syntax.is_transfer_syntax
+            and (transfer_syntax.is_compressed or index is not None)):
+        try:
+            decoder = get_decoder(transfer_syntax)
+        except NotImplementedError:
+            decoder = None
+        if decoder is not None:
+            # A pinned plugin is the only one pydicom tries, so move on to the
+            # next one ourselves when a plugin can't decode this data; '' lets
+            # pydicom pick (e.g. for a frame of uncompressed data)
+            plugins = [p for p in PIXEL_DECODER_PLUGINS if p in decoder.available_plugins]
+            if index is not None:
+                plugins.append('')
+            for plugin in plugins:
+                try:
+                    return decoder.as_array(ds, index=index, decoding_plugin=plugin)[0]
+                except Exception:
+                    pass
+    
+    # pydicom's default path, trying all of its plugins and handlers
+    pixel_array = ds.pixel_array
+    return pixel_array if index is None else pixel_array[index]
+
+def process_dicom(dicom_path, frame=0):
+    """Process a single DICOM file and return image data
+    
+    For multi-frame files only the given frame is decoded and returned (the
+    first by default); frame=None returns the whole volume, windowed slice
+    by slice. dicom_path may also be a file-like object; its name is used
+    in messages.
+    """
+    name = getattr(dicom_path, 'name', dicom_path)
     try:
         # Skip DICOMDIR files as they don't contain image data
-        if os.path.basename(dicom_path).upper() == 'DICOMDIR':
-            print(f"Skipping DICOM directory file: {dicom_path}")
+        if os.path.basename(name).upper() == 'DICOMDIR':
+            print(f"Skipping DICOM directory file: {name}")
             return None, None
             
         try:
             # Try reading with force=True to handle more DICOM variations
             ds = pydicom.dcmread(dicom_path, force=True)
             
-            # Check if this DICOM file contains pixel data
-            if not hasattr(ds, 'pixel_array'):
-                print(f"Skipping non-image DICOM file: {dicom_path}")
+            # Check if this DICOM file contains pixel data (without decoding it)
+            if 'PixelData' not in ds:
+                print(f"Skipping non-image DICOM file: {name}")
                 return None, None
                 
             # Get pixel array
             try:
-                pixel_array = ds.pixel_array
+                pixel_array = get_pixel_data(ds, index=frame)
             except Exception as e:
-                print(f"Error reading pixel data from {dicom_path}: {str(e)}")
+                print(f"Error reading pixel data from {name}: {str(e)}")
                 return None, None
                 
-            # Convert to float for processing
+            # Rescale to 0-255 directly from the native dtype (no float64 copy)
             try:
-                image_2d = pixel_array.astype(float)
-                
                 # Handle different photometric interpretations
-                photometric = getattr(ds, 'PhotometricInterpretation', '')
-                if photometric == 'MONOCHROME1':
-                    # Invert grayscale if needed
-                    image_2d = np.max(image_2d) - image_2d
-                
-                # Rescale to 0-255 range
-                max_val = np.max(image_2d)
-                min_val = np.min(image_2d)
-                
-                if max_val > min_val:  # Avoid division by zero
-                    image_2d = 255.0 * (image_2d - min_val) / (max_val - min_val)
-                
-                # Convert to uint8
-                image_2d = np.clip(image_2d, 0, 255).astype(np.uint8)
-                
+                photometric = str(getattr(ds, 'PhotometricInterpretation', ''))
+                # Window multi-frame volumes slice by slice
+                per_frame = frame is None and int(getattr(ds, 'NumberOfFrames', 1) or 1) > 1
+                normalize = _make_normalizer(pixel_array.dtype.str, photometric, per_frame)
+                image_2d = normalize(pixel_array)
+
                 return image_2d, ds
                 
             except Exception as e:
-                print(f"Error processing pixel data in {dicom_path}: {str(e)}")
+                print(f"Error processing pixel data in {name}: {str(e)}")
                 return None, None
                 
         except Exception as e:
-            print(f"Error reading DICOM file {dicom_path}: {str(e)}")
+            print(f"Error reading DICOM file {name}: {str(e)}")
             return None, None
             
     except Exception as e:
-        print(f"Unexpected error with {dicom_path}: {str(e)}")
+        print(f"Unexpected error with {name}: {str(e)}")
         return None, None
 
+def fit_preview_size(width, height, target_size):
+    """Return (width, height) scaled to fit target_size, keeping the aspect ratio"""
+    aspect_ratio = width / height
+    if aspect_ratio > 1:  # Landscape
+        new_width = min(target_size, width)
+        new_height = int(new_width / aspect_ratio)
+    else:  # Portrait or square
+        new_height = min(target_size, height)
+        new_width = int(new_height * aspect_ratio)
+    return max(1, new_width), max(1, new_height)
+
+@lru_cache(maxsize=8)
+def _lanczos_matrix(src_size, dst_size):
+    """Return the (dst_size, src_size) Lanczos-3 weights PIL's LANCZOS filter uses"""
+    scale = src_size / dst_size
+    support = max(scale, 1.0)
+    centers = (np.arange(dst_size) + 0.5) * scale
+    x = (np.arange(src_size) + 0.5 - centers[:, None]) / support
+    weights = np.sinc(x) * np.sinc(x / 3)
+    weights[np.abs(x) >= 3] = 0
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights.astype(np.float32)
+
+def lanczos_resize(arr, size):
+    """Resize a uint8 image array to size (width, height) as two cached matrix products"""
+    rows = _lanczos_matrix(arr.shape[0], size[1])
+    cols = _lanczos_matrix(arr.shape[1], size[0]).T
+    
+    def resize(channel):
+        # Horizontal pass first, rounded and clipped to 8 bits like PIL does,
+        # so Lanczos overshoot (large when upscaling) isn't carried into the
+        # vertical pass
+        out = channel.astype(np.float32) @ cols
+        out = np.floor(np.clip(out + 0.5, 0, 255), out=out)
+        return np.clip(rows @ out + 0.5, 0, 255).astype(np.uint8)
+    
+    if arr.ndim == 2:
+        return resize(arr)
+    return np.stack([resize(arr[..., c]) for c in range(arr.shape[2])], axis=-1)
+
+def load_preview_image(img_path, target_size):
+    """Load an image file and downscale it to a PIL preview of at most target_size"""
+    if _opencv_available():
+        # imdecode+fromfile instead of imread so non-ASCII paths work on Windows
+        arr = cv2.imdecode(np.fromfile(img_path, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        if arr is None:
+            raise ValueError(f"Could not decode {img_path}")
+        
+        # INTER_AREA is a box filter: the right choice (and fast) for downsampling
+        new_size = fit_preview_size(arr.shape[1], arr.shape[0], target_size)
+        arr = cv2.resize(arr, new_size, interpolation=cv2.INTER_AREA)
+        if arr.ndim == 3:
+            arr = cv2.cvtColor(arr, cv2.COLOR_BGRA2RGBA if arr.shape[2] == 4 else cv2.COLOR_BGR2RGB)
+        return Image.fromarray(arr)
+    
+    # Resize with high-quality downsampling; all tiles of a render share one
+    # target size, so the Lanczos weights are computed once and reused
+    img = Image.open(img_path)
+    new_size = fit_preview_size(img.width, img.height, target_size)
+    if img.mode in ('L', 'RGB'):
+        return Image.fromarray(lanczos_resize(np.asarray(img), new_size))
+    return img.resize(new_size, Image.Resampling.LANCZOS)
+
+def as_cv2_channels(image_data):
+    """Return RGB image_data in the BGR channel order that OpenCV writers expect"""
+    # process_dicom keeps colour images RGB end to end, while cv2.imwrite and
+    # cv2.resize treat three channels as BGR; without this red and blue swap
+    if image_data.ndim == 3 and image_data.shape[2] == 3:
+        return image_data[..., ::-1]
+    return image_data
+
+def save_png(output_path, image_data):
+    """Encode image_data as a PNG at output_path, raising if it can't be written"""
+    if _opencv_available():
+        if not cv2.imwrite(output_path, as_cv2_channels(image_data), [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION]):
+            raise IOError(f"Could not write {output_path}")
+    else:
+        Image.fromarray(image_data).save(output_path, 'PNG', compress_level=PNG_COMPRESSION)
+
+# Decoded preview PhotoImages kept in memory; tiles scrolled out of view past
+# this many are reloaded (from their small cached JPEG) when they come back
+THUMBNAIL_CACHE_SIZE = 60
+
+# Previews are read from small JPEGs cached next to the extracted images
+THUMB_DIR = '.thumbs'
+THUMB_SIZE = 400
+THUMB_JPEG_QUALITY = 85
+
+def thumb_path_for(image_path):
+    """Return the cached thumbnail path for an extracted image"""
+    folder, filename = os.path.split(image_path)
+    return os.path.join(folder, THUMB_DIR, os.path.splitext(filename)[0] + '.jpg')
+
+def save_thumbnail(image_path, image_data):
+    """Write a downscaled JPEG thumbnail of image_data for image_path.
+    
+    The caller creates the thumbnail directory once per output directory.
+    """
+    thumb_path = thumb_path_for(image_path)
+    
+    height, width = image_data.shape[:2]
+    new_size = fit_preview_size(width, height, THUMB_SIZE)
+    if _opencv_available():
+        thumb = cv2.resize(as_cv2_channels(image_data), new_size, interpolation=cv2.INTER_AREA)
+        if not cv2.imwrite(thumb_path, thumb, [cv2.IMWRITE_JPEG_QUALITY, THUMB_JPEG_QUALITY]):
+            raise IOError(f"Could not write {thumb_path}")
+    else:
+        thumb = Image.fromarray(image_data).resize(new_size, Image.Resampling.LANCZOS)
+        thumb.save(thumb_path, 'JPEG', quality=THUMB_JPEG_QUALITY)
+    return thumb_path
+
+# Extracted image files collected for the previews
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+def find_output_images(output_dir):
+    """Return the extracted images under output_dir, skipping cached thumbnails"""
+    image_paths = []
+    stack = [output_dir]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != THUMB_DIR:
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                    image_paths.append(entry.path)
+    return image_paths
+
+def _process_and_save(dicom_path, output_dir, index):
+    """Convert a DICOM file to PNG in output_dir and return the output path.
+    
+    Multi-frame files are saved as their first frame, the only one decoded.
+    Kept at module level so it can be pickled into a ProcessPoolExecutor worker.
+    """
+    image_data, ds = process_dicom(dicom_path)
+    if image_data is None:
+        return None
+    
+    # Create a descriptive filename
+    study_date = getattr(ds, 'StudyDate', 'unknown_date')
+    sop_instance_uid = getattr(ds, 'SOPInstanceUID', str(index))
+    output_filename = f"{study_date}_{sop_instance_uid}.png"
+    output_path = os.path.join(output_dir, output_filename)
+    
+    # Save the image
+    save_png(output_path, image_data)
+    
+    # A missing thumbnail only means the preview falls back to the full image
+    try:
+        save_thumbnail(output_path, image_data)
+    except Exception as e:
+        print(f"Error saving thumbnail for {output_path}: {e}")
+    return output_path
+
+# The ZIP a worker process is reading members from, see _open_zip
+_worker_zip = None
+
+def _close_worker_zip():
+    """Close the ZIP held open by _open_zip, if any"""
+    global _worker_zip
+    if _worker_zip is not None:
+        _worker_zip.close()
+        _worker_zip = None
+
+def _open_zip(zip_path):
+    """Open a ZIP once per worker process instead of once per member.
+    
+    The previous ZIP is closed when another one is opened, and the last one
+    when the worker exits.
+    """
+    global _worker_zip
+    if _worker_zip is None or _worker_zip.filename != zip_path:
+        if _worker_zip is None:
+            atexit.register(_close_worker_zip)
+        _close_worker_zip()
+        _worker_zip = zipfile.ZipFile(zip_path, 'r')
+    return _worker_zip
+
+def _process_zip_member_and_save(zip_path, member, output_dir, index):
+    """Convert a DICOM member of a ZIP to PNG in output_dir without extracting it"""
+    source = BytesIO(_open_zip(zip_path).read(member))
+    source.name = member
+    return _process_and_save(source, output_dir, index)
+
+# 'DICM' magic at offset 128 read as one little-endian uint32
+_DICM_MAGIC = int.from_bytes(b'DICM', 'little')
+
 def is_dicom_file_content(file_content):
     """Check if the given file content is a DICOM file"""
+    # Check for DICOM magic number (DICM at position 128); startswith with an
+    # offset compares in place and is simply False for content that's too short
+    return file_content.startswith(b'DICM', 128)
+
+def is_raw_dicom_content(file_content):
+    """Check if the given content could be a DICOM data set without the 128-byte preamble"""
+    # A bare data set starts with a little-endian file meta (0002) or
+    # identifying (0008) group tag; anything else is not worth parsing
+    return file_content[:2] in (b'\x02\x00', b'\x08\x00')
+
+def dicom_header_mask(headers):
+    """Check many headers (each at most 132 bytes) at once; returns a bool array"""
+    blob = b''.join(headers)
+    if len(blob) != 132 * len(headers):
+        # Some headers are short; pad them so each occupies one 132-byte row
+        blob = b''.join(h.ljust(132, b'\0') for h in headers)
+    magic = np.frombuffer(blob, dtype='<u4').reshape(-1, 33)[:, 32]
+    return magic == np.uint32(_DICM_MAGIC)
+
+def read_zip_member_head(zf, info, size=132):
+    """Read the first size bytes of a ZIP member.
+    
+    Uncompressed (STORED) members are read straight from the archive file,
+    skipping the per-entry decompressor setup that ZipFile.open performs.
+    """
+    if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+        zf.fp.seek(info.header_offset)
+        local_header = zf.fp.read(30)
+        if len(local_header) == 30 and local_header[:4] == b'PK\x03\x04':
+            # The local header's name/extra lengths can differ from the central directory's
+            name_len, extra_len = struct.unpack('<HH', local_header[26:30])
+            zf.fp.seek(info.header_offset + 30 + name_len + extra_len)
+            return zf.fp.read(min(size, info.file_size))
+    
+    with zf.open(info) as f:
+        return f.read(size)
+
+def candidate_members(zf):
+    """Return the members of a ZIP that may hold a DICOM image.
+    
+    Skips directories, DICOMDIR and files too small for the 132-byte DICOM header.
+    """
+    return [info for info in zf.infolist()
+            if not info.is_dir() and info.file_size > 132
+            and os.path.basename(info.filename).upper() != 'DICOMDIR']
+
+def list_dicom_members(zf, infos):
+    """Return the names of the members in infos whose header has the DICOM signature"""
+    names, headers = [], []
+    for info in infos:
+        try:
+            headers.append(read_zip_member_head(zf, info))
+            names.append(info.filename)
+        except Exception as e:
+            print(f"  Warning: Could not check {info.filename}: {str(e)}")
+    return [name for name, is_dicom in zip(names, dicom_header_mask(headers)) if is_dicom]
+
+def read_members_ahead(zip_path, names, maxsize=16):
+    """Yield (name, data) for the named ZIP members, read ahead on a background thread.
+    
+    Inflating is done by zlib outside the GIL, so reading the next members
+    overlaps with whatever the caller does with the current one.
+    """
+    members = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    
+    def reader():
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zf:
+                for name in names:
+                    if stop.is_set():
+                        break
+                    try:
+                        members.put((name, zf.read(name)))
+                    except Exception as e:
+                        print(f"  Warning: Could not read {name}: {str(e)}")
+        except Exception as e:
+            print(f"Error reading {zip_path}: {e}")
+        finally:
+            members.put(None)
+    
+    threading.Thread(target=reader, daemon=True).start()
     try:
-        # Check for DICOM magic number (DICM at position 128)
-        if len(file_content) >= 132 and file_content[128:132] == b'DICM':
-            return True
-            
-        # Some DICOM files don't have the magic number but start with a valid DICOM prefix
-        if len(file_content) >= 4 and file_content.startswith((b'\x01\x00', b'\x02\x00', b'\x08\x00')):
-            return True
-    except:
-        pass
-    return False
+        while True:
+            item = members.get()
+            if item is None:
+                return
+            yield item
+    finally:
+        # If the caller stopped early, unblock the reader and let it finish
+        stop.set()
+        while item is not None:
+            item = members.get()
 
 def check_zip_contents(zip_path):
     """Check the contents of a ZIP file and count DICOM files"""
@@ -125,18 +606,20 @@ def check_zip_contents(zip_path):
             all_files = zf.namelist()
             print(f"Total files in ZIP: {len(all_files)}")
             
-            # Find DICOM files by content
-            dicom_files = []
-            for file_name in all_files:
+            # Find DICOM files by content; entries shorter than the 132-byte
+            # preamble+magic can't carry a DICOM signature, so skip them unread
+            names, headers = [], []
+            for info in zf.infolist():
+                if info.is_dir() or info.file_size < 132:
+                    continue
                 try:
-                    # Skip directories and non-DICOM files by extension first (faster check)
-                    if not file_name.endswith('/'):  # Skip directories
-                        with zf.open(file_name) as f:
-                            content = f.read(132)  # Read first 132 bytes to check DICOM signature
-                            if is_dicom_file_content(content):
-                                dicom_files.append(file_name)
+                    headers.append(read_zip_member_head(zf, info))
+                    names.append(info.filename)
                 except Exception as e:
-                    print(f"  Warning: Could not check {file_name}: {str(e)}")
+                    print(f"  Warning: Could not check {info.filename}: {str(e)}")
+            
+            # Check all collected headers for the DICOM signature in one pass
+            dicom_files = {name for name, is_dicom in zip(names, dicom_header_mask(headers)) if is_dicom}
             
             print(f"DICOM files found: {len(dicom_files)}")
             
@@ -162,19 +645,19 @@ def process_dicom_folder(folder_path):
         try:
             # Try to read the DICOM file with force=True to handle most cases
             try:
-                # First try with standard reading
-                print("  - Attempting standard DICOM read...")
-                ds = pydicom.dcmread(dicom_path, force=True)
+                # First try with defer_size so large values (PixelData) stay on disk until needed
+                print("  - Attempting deferred DICOM read...")
+                ds = pydicom.dcmread(dicom_path, force=True, defer_size='1 KB')
                 print("  - Successfully read DICOM file")
                 
             except Exception as e:
-                print(f"  - Error reading with standard method: {str(e)}")
-                print("  - Trying with defer_size...")
+                print(f"  - Error reading with deferred method: {str(e)}")
+                print("  - Trying standard read...")
                 
-                # If that fails, try with defer_size
+                # If that fails, try reading everything up front
                 try:
-                    ds = pydicom.dcmread(dicom_path, force=True, defer_size='1 KB')
-                    print("  - Successfully read with defer_size")
+                    ds = pydicom.dcmread(dicom_path, force=True)
+                    print("  - Successfully read with standard method")
                 except Exception as e2:
                     print(f"  - Failed to read DICOM: {str(e2)}")
                     if not HAS_PYLIBJPEG and ('decompression' in str(e2).lower() or 'jpeg' in str(e2).lower()):
@@ -183,21 +666,16 @@ def process_dicom_folder(folder_path):
                         print("pip install pylibjpeg pylibjpeg-libjpeg")
                         print("Or if you're using conda:")
                         print("conda install -c conda-forge pylibjpeg pylibjpeg-libjpeg")
-                    return None
+                    return None, None
             
-            # Check if the DICOM has pixel data
-            if hasattr(ds, 'pixel_array'):
+            # Check if the DICOM has pixel data (without decoding it)
+            if 'PixelData' in ds:
                 try:
                     print("  - Extracting pixel data...")
-                    # Try to get the pixel array
-                    if HAS_PYLIBJPEG and hasattr(ds, 'file_meta') and 'JPEG' in str(ds.file_meta.get('TransferSyntaxUID', '')):
-                        print("  - Using pylibjpeg for JPEG compressed DICOM")
-                        img = get_pixel_data(ds)
-                    else:
-                        print("  - Using standard pixel_array extraction")
-                        img = ds.pixel_array
+                    img = get_pixel_data(ds)
                     
-                    print(f"  - Extracted image dimensions: {img.shape if hasattr(img, 'shape') else 'N/A'}")
+                    image_size = img.shape if hasattr(img, 'shape') else 'N/A'
+                    print(f"  - Extracted image dimensions: {image_size}")
                 except Exception as e:
                     print(f"Error reading pixel data from {dicom_path}: {str(e)}")
                     if 'decompression' in str(e).lower():
@@ -210,18 +688,21 @@ def process_dicom_folder(folder_path):
                                 print("pip install pylibjpeg pylibjpeg-libjpeg")
                                 print("Or if you're using conda:")
                                 print("conda install -c conda-forge pylibjpeg pylibjpeg-libjpeg")
-                            return None
+                            return None, None
                         except Exception as inner_e:
                             print(f"Failed to handle compressed DICOM: {str(inner_e)}")
-                            return None
+                            return None, None
                 
                 # Normalize the image
                 try:
                     print("  - Normalizing image...")
-                    img = self.normalize_image(img)
-                    
-                    # Convert to 8-bit
-                    img = (img * 255).astype('uint8')
+                    # Min-max scale straight to 8-bit in one pass; OpenCV treats a
+                    # trailing axis as channels, so flatten volumes to 2D first
+                    flat = img.reshape(img.shape[0], -1) if img.ndim > 2 else img
+                    flat = cv2.normalize(flat, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+                    if getattr(ds, 'PhotometricInterpretation', '') == 'MONOCHROME1':
+                        cv2.bitwise_not(flat, dst=flat)
+                    img = flat.reshape(img.shape)
                     
                     # Generate output filename
                     output_filename = f"dicom_{file_index:04d}.png"
@@ -229,35 +710,39 @@ def process_dicom_folder(folder_path):
                     
                     # Save as PNG
                     print(f"  - Saving image to {output_path}...")
-                    cv2.imwrite(output_path, img)
+                    cv2.imwrite(output_path, as_cv2_channels(img), [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION])
                     print(f"  - Successfully saved {output_filename}")
                     
-                    return output_path
+                    # Hand back the metadata so the caller doesn't have to re-read the file
+                    metadata = {
+                        'Patient Name': getattr(ds, 'PatientName', 'N/A'),
+                        'Study Date': getattr(ds, 'StudyDate', 'N/A'),
+                        'Modality': getattr(ds, 'Modality', 'N/A'),
+                        'Image Size': image_size,
+                    }
+                    return output_path, metadata
                 except Exception as e:
                     print(f"  - Error processing image: {str(e)}")
-                    return None
+                    return None, None
             else:
                 print(f"No pixel data found in {dicom_path}")
-                return None
+                return None, None
                 
         except Exception as e:
             print(f"Error processing {dicom_path}: {str(e)}")
-            return None
+            return None, None
     
     for root, _, files in os.walk(folder_path):
         for file in files:
             if file.lower().endswith(('.dcm', '.dicom')):
                 dicom_path = os.path.join(root, file)
-                output_path = process_dicom_file(self=None, dicom_path=dicom_path, output_dir=output_dir, file_index=0, total_files=0)
+                output_path, metadata = process_dicom_file(self=None, dicom_path=dicom_path, output_dir=output_dir, file_index=0, total_files=0)
                 
                 if output_path is not None:
-                    # Print DICOM metadata
-                    ds = pydicom.dcmread(dicom_path)
+                    # Print DICOM metadata captured during processing
                     print(f"\nDICOM Info for {file}:")
-                    print(f"Patient Name: {getattr(ds, 'PatientName', 'N/A')}")
-                    print(f"Study Date: {getattr(ds, 'StudyDate', 'N/A')}")
-                    print(f"Modality: {getattr(ds, 'Modality', 'N/A')}")
-                    print(f"Image Size: {ds.pixel_array.shape}")
+                    for key, value in metadata.items():
+                        print(f"{key}: {value}")
                     print("-" * 50)
 
 class DICOMExtractorApp:
@@ -269,6 +754,24 @@ class DICOMExtractorApp:
         self.image_paths = []  # Store paths to extracted images
         self._resize_id = None  # For debouncing window resize events
         self.current_previews = []  # Store current preview widgets
+        self._thumbnail_cache = {}  # (path, target_size) -> ImageTk.PhotoImage
+        self._thumbnail_size = None  # target_size the cached thumbnails were built for
+        self._photo_pool = {}  # (mode, size) -> spare PhotoImages to paste new thumbnails into
+        self._tile_rows = []  # (row_frame, [img_path, ...]) for each preview row, top to bottom
+        self._tile_labels = {}  # img_path -> preview image label
+        self._failed_thumbs = set()  # Paths whose thumbnail could not be loaded
+        self._blank_photo = None  # Placeholder shown until a tile scrolls into view
+        self._tile_render_id = None  # Pending after_idle() id for rendering visible tiles
+        self.save_pool = ThreadPoolExecutor(max_workers=os.cpu_count())  # Background PNG encoding
+        self._convert_pool = None  # Process pool of the running batch, see _run_processing
+        self._cleanup_threads = []  # Background temp-dir deletions, joined at exit
+        self._status_queue = queue.Queue()  # (message, progress) from the worker thread
+        self._status_drain_id = None  # Pending after() id for draining the status queue
+        self._last_status_t = 0.0  # time.monotonic() of the last progress update let through
+        
+        # Worker thread -> main thread notifications
+        self.root.bind('<<StatusQueued>>', self._schedule_status_drain)
+        self.root.bind('<<ProcessingDone>>', self._on_processing_done)
         
         # Enable drag and drop
         self.root.drop_target_register('DND_Files')
@@ -314,26 +817,28 @@ class DICOMExtractorApp:
         self.file_frame.columnconfigure(0, weight=1)
         self.file_frame.rowconfigure(0, weight=1)  # Allow the file list to expand
         
-        # Text widget for displaying multiple files
-        text_frame = ttk.Frame(self.file_frame)
-        text_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Treeview for displaying multiple files (read-only, and inserting rows
+        # doesn't re-layout the whole widget the way a Text widget does)
+        list_frame = ttk.Frame(self.file_frame)
+        list_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Add scrollbar for the text widget
-        text_scroll = ttk.Scrollbar(text_frame)
-        text_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        # Add scrollbar for the file list
+        list_scroll = ttk.Scrollbar(list_frame)
+        list_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.file_text = tk.Text(
-            text_frame,
+        self.file_list = ttk.Treeview(
+            list_frame,
+            show='tree',
             height=4,
-            wrap=tk.WORD,
-            yscrollcommand=text_scroll.set
+            selectmode='none',
+            yscrollcommand=list_scroll.set
         )
-        self.file_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        text_scroll.config(command=self.file_text.yview)
+        self.file_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        list_scroll.config(command=self.file_list.yview)
         
-        # Store file paths
+        # Store file paths (insertion-ordered dict mirroring the file list for O(1) dedup)
         self.file_path = tk.StringVar()
-        self.file_text.bind('<Key>', lambda e: 'break')  # Make read-only
+        self._paths = {}
         
         # Button frame
         btn_frame = ttk.Frame(self.file_frame)
@@ -434,7 +939,7 @@ class DICOMExtractorApp:
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(
-            yscrollcommand=self.scrollbar_y.set,
+            yscrollcommand=self._on_canvas_yscroll,
             xscrollcommand=self.scrollbar_x.set
         )
         
@@ -486,6 +991,8 @@ class DICOMExtractorApp:
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
         self.current_previews = []
+        self._tile_rows = []
+        self._tile_labels = {}
     
     def _bind_resize_event(self):
         """Bind the window resize event after the window is fully initialized"""
@@ -509,38 +1016,35 @@ class DICOMExtractorApp:
     def _ensure_images_loaded(self):
         """Ensure images are loaded, extracting from ZIPs if necessary"""
         if not hasattr(self, 'current_image_paths') or not self.current_image_paths:
-            # Get the list of files from the text widget
-            file_paths = self.file_text.get('1.0', tk.END).strip().split('\n')
-            file_paths = [f.strip() for f in file_paths if f.strip()]
+            # Get the list of files shown in the file list
+            file_paths = list(self._paths)
             
             if not file_paths:
                 messagebox.showinfo("No Files", "No files available to process. Please add DICOM files or ZIP archives first.")
                 return False
                 
-            # Process the files to extract images
-            self.image_paths = []
+            # Process the files to extract images as a pipeline: ZIP members are
+            # read ahead on a background thread, decoded here, and PNG encoding
+            # runs on the save pool (OpenCV releases the GIL)
+            saves = []
             temp_dir = os.path.join(tempfile.gettempdir(), 'dicom_extractor')
             os.makedirs(temp_dir, exist_ok=True)
             
             for file_path in file_paths:
                 if file_path.lower().endswith('.zip'):
                     try:
-                        # Extract ZIP and process DICOM files
-                        extract_dir = os.path.join(temp_dir, os.path.basename(file_path) + '_extracted')
-                        os.makedirs(extract_dir, exist_ok=True)
-                        extract_zip(file_path, extract_dir)
-                        
-                        # Find and process DICOM files in the extracted directory
-                        dicom_files = find_dicom_files(extract_dir)
-                        for dicom_file in dicom_files:
-                            img_data, ds = process_dicom(dicom_file)
+                        # Process only the DICOM members of the ZIP, without extracting them
+                        with zipfile.ZipFile(file_path, 'r') as zf:
+                            dicom_members = list_dicom_members(zf, candidate_members(zf))
+                        for member, data in read_members_ahead(file_path, dicom_members):
+                            source = BytesIO(data)
+                            source.name = member
+                            img_data, ds = process_dicom(source)
                             if img_data is not None:
                                 # Save the image to a temporary file
-                                img = Image.fromarray(img_data)
-                                img_filename = f"{os.path.splitext(os.path.basename(dicom_file))[0]}.png"
+                                img_filename = f"{os.path.splitext(os.path.basename(member))[0]}.png"
                                 img_path = os.path.join(temp_dir, img_filename)
-                                img.save(img_path)
-                                self.image_paths.append(img_path)
+                                saves.append((img_path, self.save_pool.submit(save_png, img_path, img_data)))
                     except Exception as e:
                         print(f"Error processing {file_path}: {e}")
                 else:
@@ -548,14 +1052,21 @@ class DICOMExtractorApp:
                     try:
                         img_data, ds = process_dicom(file_path)
                         if img_data is not None:
-                            img = Image.fromarray(img_data)
                             img_filename = f"{os.path.splitext(os.path.basename(file_path))[0]}.png"
                             img_path = os.path.join(temp_dir, img_filename)
-                            img.save(img_path)
-                            self.image_paths.append(img_path)
+                            saves.append((img_path, self.save_pool.submit(save_png, img_path, img_data)))
                     except Exception as e:
                         print(f"Error processing {file_path}: {e}")
             
+            # Wait for the pending saves and keep only the images that were written
+            self.image_paths = []
+            for img_path, future in saves:
+                try:
+                    future.result()
+                    self.image_paths.append(img_path)
+                except Exception as e:
+                    print(f"Error saving {img_path}: {e}")
+            
             if not self.image_paths:
                 messagebox.showinfo("No Images", "No DICOM images could be extracted from the provided files.")
                 return False
@@ -704,9 +1215,22 @@ class DICOMExtractorApp:
         """Export the extracted images as animated GIFs or MP4s, grouped by resolution"""
         self._create_animation(output_format)
     
+    def _add_to_file_list(self, paths):
+        """Append paths (already de-duplicated) to the file list"""
+        self._paths.update(dict.fromkeys(paths))
+        for path in paths:
+            self.file_list.insert('', tk.END, text=path)
+    
+    def _clear_file_list(self):
+        """Remove all paths from the file list"""
+        self.file_list.delete(*self.file_list.get_children())
+        self._paths.clear()
+    
     def reset_application(self):
         """Reset the application to its initial state"""
-        self.file_text.delete(1.0, tk.END)
+        self._clear_file_list()
+        self._thumbnail_cache.clear()
+        self._photo_pool.clear()
         self.progress['value'] = 0
         self.root.title("")
         self.process_btn.config(state=tk.NORMAL)
@@ -716,13 +1240,13 @@ class DICOMExtractorApp:
         """Check if a file is a DICOM file"""
         try:
             # Quick check by extension first (faster)
-            if file_path.lower().endswith(('.dcm', '.dicom', '.ima')):
+            if file_path.lower().endswith(DICOM_EXTENSIONS):
                 return True
             # Then check file signature
             with open(file_path, 'rb') as f:
                 header = f.read(132)  # DICOM header is at least 132 bytes
-                return header[128:132] == b'DICM'
-        except:
+                return is_dicom_file_content(header)
+        except OSError:
             return False
     
     def scan_for_dicom(self, path):
@@ -734,11 +1258,20 @@ class DICOMExtractorApp:
                 return [path]
             return []
             
-        for root, _, files in os.walk(path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if self.is_dicom_file(file_path) or file.lower().endswith('.zip'):
-                    dicom_files.append(file_path)
+        candidates = [entry.path for entry in _walk_scandir(path)
+                      if entry.name.upper() != 'DICOMDIR']
+        if not candidates:
+            return dicom_files
+
+        def is_candidate(file_path):
+            # One lowercase copy and one suffix scan covers ZIPs and DICOM extensions
+            if file_path.lower().endswith(CANDIDATE_EXTENSIONS):
+                return True
+            return self.is_dicom_file(file_path)
+
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            flags = list(executor.map(is_candidate, candidates))
+        dicom_files.extend(p for p, ok in zip(candidates, flags) if ok)
         
         return dicom_files
 
@@ -757,16 +1290,12 @@ class DICOMExtractorApp:
             
             # Update the file list with new valid paths
             if valid_paths:
-                current_files = self.file_text.get('1.0', tk.END).splitlines()
-                current_files = [f.strip() for f in current_files if f.strip()]
-                
                 # Add only new files that aren't already in the list
-                new_files = [f for f in valid_paths if f not in current_files]
+                new_files = [f for f in dict.fromkeys(valid_paths) if f not in self._paths]
                 
                 if new_files:
-                    for path in new_files:
-                        self.file_text.insert(tk.END, path + '\n')
-                    self.file_path.set("\n".join(set(current_files + new_files)))
+                    self._add_to_file_list(new_files)
+                    self.file_path.set("\n".join(self._paths))
                     if hasattr(self, 'image_paths') and self.image_paths:
                         self.root.after(100, lambda: self.show_image_previews(self.image_paths))
                         if hasattr(self, 'canvas'):
@@ -783,19 +1312,26 @@ class DICOMExtractorApp:
                     self.root.after_cancel(self._resize_id)
                 except:
                     pass  # Ignore errors from invalid after_id
-            self._resize_id = self.root.after(200, self._delayed_resize)
+            self._resize_id = self.root.after(150, self._delayed_resize)
     
     def _delayed_resize(self):
         """Handle delayed window resize to prevent excessive updates"""
+        self._resize_id = None
         if hasattr(self, 'current_image_paths') and self.current_image_paths:
+            # Only a change in column count needs the grid rebuilt
+            window_width = self.canvas.winfo_width()
+            if window_width < 1:
+                window_width = 800
+            if max(2, min(6, window_width // 200)) == getattr(self, 'current_columns', -1):
+                return
+            
             try:
                 # Store scroll position
                 x_view = self.canvas.xview()[0]
                 y_view = self.canvas.yview()[0]
                 
-                # Update previews
-                current_paths = self.current_image_paths.copy()
-                self.show_image_previews(current_paths)
+                # Update previews (thumbnails come from the cache, not from disk)
+                self.show_image_previews(self.current_image_paths)
                 
                 # Restore scroll position
                 self.canvas.xview_moveto(x_view)
@@ -827,12 +1363,12 @@ class DICOMExtractorApp:
         # Update the file list with valid paths
         if valid_paths:
             # Clear existing content
-            self.file_text.delete(1.0, tk.END)
+            self._clear_file_list()
             
-            # Add all valid paths to the text widget
-            for path in valid_paths:
-                self.file_text.insert(tk.END, path + '\n')
-            self.file_path.set("\n".join(valid_paths))
+            # Add all valid paths to the file list
+            new_files = list(dict.fromkeys(valid_paths))
+            self._add_to_file_list(new_files)
+            self.file_path.set("\n".join(new_files))
             
             # If we have image paths, update the preview
             if hasattr(self, 'image_paths') and self.image_paths:
@@ -841,21 +1377,57 @@ class DICOMExtractorApp:
             messagebox.showinfo("No Valid Files", "No DICOM or ZIP files found in the selected location.")
     
     def update_status(self, message, progress=None):
-        """Update the progress bar and window title with status"""
+        """Update the progress bar and window title with status.
+        
+        Safe to call from the worker thread: updates are queued and applied
+        by the main thread. Progress updates are limited to about 20 per second;
+        messages without progress and completion (100) always go through.
+        """
+        if progress is not None and progress < 100:
+            now = time.monotonic()
+            if now - self._last_status_t < 0.05:
+                return
+            self._last_status_t = now
+        
+        if threading.current_thread() is threading.main_thread():
+            self._apply_status(message, progress)
+            return
+        
+        self._status_queue.put((message, progress))
+        try:
+            self.root.event_generate('<<StatusQueued>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass  # The window was closed while processing
+    
+    def _apply_status(self, message, progress=None):
+        """Apply a status update to the widgets (main thread only)"""
         self.root.title(f"{message}")
-        if progress is not None:
-            self.progress['value'] = progress
-            self.root.update_idletasks()
-        else:
-            self.progress['value'] = 0
-            self.root.update_idletasks()
+        self.progress['value'] = progress if progress is not None else 0
+        self.root.update_idletasks()
     
-    def start_processing(self):
-        # Get paths from the text widget and clean them up
-        zip_paths = [p.strip() for p in self.file_text.get('1.0', tk.END).split('\n') if p.strip()]
+    def _schedule_status_drain(self, event=None):
+        """Coalesce queued status updates into one redraw every 50 ms"""
+        if self._status_drain_id is None:
+            self._status_drain_id = self.root.after(50, self._drain_status_queue)
+    
+    def _drain_status_queue(self):
+        """Apply the latest queued status update and stop until more arrive"""
+        if self._status_drain_id is not None:
+            self.root.after_cancel(self._status_drain_id)
+            self._status_drain_id = None
         
-        # Remove any empty strings that might have been created
-        zip_paths = [p for p in zip_paths if p]
+        latest = None
+        try:
+            while True:
+                latest = self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if latest is not None:
+            self._apply_status(*latest)
+    
+    def start_processing(self):
+        # Get paths from the file list
+        zip_paths = list(self._paths)
         
         if not zip_paths:
             messagebox.showerror("Error", "Please add at least one file or folder first!")
@@ -884,62 +1456,66 @@ class DICOMExtractorApp:
         self.root.update_idletasks()
         
         # Start processing in a separate thread to keep the UI responsive
+        # (completion is signalled back via <<ProcessingDone>>, no polling needed)
         self.thread = threading.Thread(
-            target=self.process_multiple_zips,
+            target=self._run_processing,
             args=(valid_paths,),
             daemon=True
         )
         self.thread.start()
-        
-        # Check thread status periodically
-        self.check_thread()
+    
+    def _run_processing(self, file_paths):
+        """Worker thread body: process the files, then notify the main thread"""
+        # One process pool for the whole batch. Its workers are spawned, not
+        # forked: a fork of this multithreaded Tk process could copy a lock
+        # held by another thread and deadlock. The default worker count is the
+        # CPU count, capped at 61 on Windows where more raises
+        self._convert_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+        try:
+            self.process_multiple_zips(file_paths)
+        finally:
+            self._convert_pool.shutdown()
+            self._convert_pool = None
+            try:
+                # event_generate is the one Tk call that is safe from a worker thread
+                self.root.event_generate('<<ProcessingDone>>', when='tail')
+            except (tk.TclError, RuntimeError):
+                pass  # The window was closed while processing
     
     def process_multiple_zips(self, file_paths):
-        """Process multiple files or folders sequentially"""
+        """Process ZIP files sequentially and single DICOM files in parallel"""
         total_files = len(file_paths)
         all_image_paths = []
+        single_files = []
+        done = 0
         
         for i, file_path in enumerate(file_paths, 1):
-            current_progress = (i - 1) * 100 // total_files
-            self.update_status(f"Processing {i} of {total_files}: {os.path.basename(file_path)[:30]}...", 
+            if not file_path.lower().endswith('.zip'):
+                single_files.append((i, file_path))
+                continue
+            
+            current_progress = done * 100 // total_files
+            self.update_status(f"Processing {done + 1} of {total_files}: {os.path.basename(file_path)[:30]}...", 
                              current_progress)
             
-            if file_path.lower().endswith('.zip'):
-                output_dir = self.process_zip(file_path, i-1, total_files)
-                
-                # Collect all image paths from this output directory
-                if output_dir and os.path.exists(output_dir):
-                    for root, _, files in os.walk(output_dir):
-                        for file in files:
-                            if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-                                all_image_paths.append(os.path.join(root, file))
-            else:
-                # Process single DICOM file
-                try:
-                    output_dir = os.path.join(os.path.expanduser("~"), "DICOM_Extracted", "Single_Files")
-                    os.makedirs(output_dir, exist_ok=True)
-                    
-                    # Process the DICOM file
-                    image_data, ds = process_dicom(file_path)
-                    if image_data is not None:
-                        # Create a descriptive filename
-                        study_date = getattr(ds, 'StudyDate', 'unknown_date')
-                        sop_instance_uid = getattr(ds, 'SOPInstanceUID', str(i))
-                        output_filename = f"{study_date}_{sop_instance_uid}.png"
-                        output_path = os.path.join(output_dir, output_filename)
-                        
-                        # Save the image
-                        if OPENCV_AVAILABLE:
-                            cv2.imwrite(output_path, image_data)
-                        else:
-                            img = Image.fromarray(image_data) if len(image_data.shape) == 2 else \
-                                  Image.fromarray(cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB))
-                            img.save(output_path)
-                        
-                        all_image_paths.append(output_path)
-                        
-                except Exception as e:
-                    print(f"Error processing {file_path}: {e}")
+            output_dir = self.process_zip(file_path, done, total_files)
+            done += 1
+            
+            # Collect all image paths from this output directory
+            if output_dir and os.path.exists(output_dir):
+                all_image_paths.extend(find_output_images(output_dir))
+        
+        if single_files:
+            output_dir = os.path.join(os.path.expanduser("~"), "DICOM_Extracted", "Single_Files")
+            os.makedirs(os.path.join(output_dir, THUMB_DIR), exist_ok=True)  # Creates output_dir too
+            
+            # Decode single DICOM files in worker processes to sidestep the GIL
+            for _, file_path, output_path in self._convert_in_pool(single_files, output_dir):
+                done += 1
+                self.update_status(f"Processing {done} of {total_files}: {os.path.basename(file_path)[:30]}...",
+                                 done * 100 // total_files)
+                if output_path is not None:
+                    all_image_paths.append(output_path)
         
         # Update progress to 100%
         self.update_status("Processing complete!", 100)
@@ -948,16 +1524,43 @@ class DICOMExtractorApp:
         if all_image_paths:
             self.root.after(100, lambda: self.show_image_previews(all_image_paths))
     
-    def check_thread(self):
-        if self.thread.is_alive():
-            self.root.after(100, self.check_thread)
+    def _convert_in_pool(self, jobs, output_dir, zip_path=None):
+        """Convert (index, dicom_path) jobs to PNGs in output_dir on the batch's process pool.
+        
+        If zip_path is given, each dicom_path names a member of that ZIP, which the
+        workers read straight from the archive.
+        Yields (completed_count, dicom_path, output_path) as each file finishes;
+        output_path is None if the file could not be converted.
+        """
+        executor = self._convert_pool
+        if zip_path is None:
+            futures = {
+                executor.submit(_process_and_save, dicom_path, output_dir, index): dicom_path
+                for index, dicom_path in jobs
+            }
         else:
-            self.process_btn.config(state=tk.NORMAL)
-            self.browse_btn.config(state=tk.NORMAL)
-            
-            # Show completion message if processing was successful
-            if self.progress['value'] == 100:
-                self.update_status("✅ Processing completed successfully!")
+            futures = {
+                executor.submit(_process_zip_member_and_save, zip_path, member, output_dir, index): member
+                for index, member in jobs
+            }
+        for completed, future in enumerate(as_completed(futures), 1):
+            dicom_path = futures[future]
+            try:
+                output_path = future.result()
+            except Exception as e:
+                print(f"Error processing {dicom_path}: {e}")
+                output_path = None
+            yield completed, dicom_path, output_path
+    
+    def _on_processing_done(self, event=None):
+        """Re-enable the UI once the worker thread has finished"""
+        self._drain_status_queue()
+        self.process_btn.config(state=tk.NORMAL)
+        self.browse_btn.config(state=tk.NORMAL)
+        
+        # Show completion message if processing was successful
+        if self.progress['value'] == 100:
+            self.update_status("✅ Processing completed successfully!")
     
     def open_image(self, image_path):
         """Open image in default system viewer"""
@@ -980,29 +1583,29 @@ class DICOMExtractorApp:
         # Store the current image paths for resize events
         self.current_image_paths = image_paths
         
+        # Preview from the cached thumbnails where extraction wrote one
+        self.current_thumb_paths = {}
+        for img_path in image_paths:
+            thumb_path = thumb_path_for(img_path)
+            self.current_thumb_paths[img_path] = thumb_path if os.path.exists(thumb_path) else img_path
+        
         # Clear previous previews
         self._clear_previews()
         
-        # Calculate available width for previews
-        window_width = self.canvas.winfo_width()
-        if window_width < 1:
-            window_width = 800  # Default width if not yet rendered
-        
-        # Calculate number of columns based on window width
+        # Calculate available width for previews (one Tcl round trip per render)
         window_width = self.canvas.winfo_width()
         if window_width < 1:  # In case window isn't mapped yet
             window_width = 800  # Default width
             
         # Calculate number of columns (minimum 2, maximum 6)
         self.current_columns = max(2, min(6, window_width // 200))  # Each image takes ~200px
+        target_size = (window_width // self.current_columns) - 30  # Account for padding
         
-        # Group images by their parent directory (ZIP file)
-        zip_groups = {}
+        # Group images by their parent directory (one output directory per ZIP file)
+        dir_groups = defaultdict(list)
         for img_path in image_paths:
-            zip_name = os.path.basename(os.path.dirname(os.path.dirname(img_path)))
-            if zip_name not in zip_groups:
-                zip_groups[zip_name] = []
-            zip_groups[zip_name].append(img_path)
+            dir_groups[os.path.dirname(img_path)].append(img_path)
+        zip_groups = {os.path.basename(folder): paths for folder, paths in dir_groups.items()}
             
         # Sort images within each group using natural sort
         def natural_sort_key(s):
@@ -1013,6 +1616,22 @@ class DICOMExtractorApp:
         for zip_name in zip_groups:
             zip_groups[zip_name].sort(key=natural_sort_key)
         
+        # Thumbnails for another size are stale, drop them to bound memory
+        if target_size != self._thumbnail_size:
+            self._thumbnail_cache.clear()
+            self._photo_pool.clear()
+            self._thumbnail_size = target_size
+        else:
+            # Recycle the PhotoImages of images no longer shown
+            shown = set(image_paths)
+            for key in [key for key in self._thumbnail_cache if key[0] not in shown]:
+                self._recycle_photo(self._thumbnail_cache.pop(key))
+        
+        # Tiles start out as fixed-size placeholders; thumbnails are only loaded
+        # for the tiles in view, see _render_visible_tiles
+        self._blank_photo = tk.PhotoImage(width=target_size, height=target_size)
+        self._failed_thumbs = set()
+        
         # Show previews grouped by ZIP file
         for zip_name, img_list in zip_groups.items():
             # Add ZIP file header
@@ -1032,6 +1651,7 @@ class DICOMExtractorApp:
             # Create a frame for each row of previews
             row_frame = ttk.Frame(preview_frame)
             row_frame.pack(fill=tk.X)
+            self._tile_rows.append((row_frame, []))
             
             for i, img_path in enumerate(img_list):
                 try:
@@ -1039,35 +1659,24 @@ class DICOMExtractorApp:
                     if i > 0 and i % self.current_columns == 0:
                         row_frame = ttk.Frame(preview_frame)
                         row_frame.pack(fill=tk.X)
+                        self._tile_rows.append((row_frame, []))
                     
                     # Create a frame for each image preview
                     img_frame = ttk.Frame(row_frame, padding=5, relief='groove', borderwidth=1)
                     img_frame.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.BOTH, expand=True)
                     
-                    # Load and resize image for preview
-                    img = Image.open(img_path)
-                    
-                    # Get target size based on window width
-                    cols = max(2, min(6, self.canvas.winfo_width() // 200))  # Target 200px per image
-                    target_size = (self.canvas.winfo_width() // cols) - 30  # Account for padding
-                    
-                    # Maintain aspect ratio
-                    aspect_ratio = img.width / img.height
-                    if aspect_ratio > 1:  # Landscape
-                        new_width = min(target_size, img.width)
-                        new_height = int(new_width / aspect_ratio)
-                    else:  # Portrait or square
-                        new_height = min(target_size, img.height)
-                        new_width = int(new_height * aspect_ratio)
-                        
-                    # Resize with high-quality downsampling
-                    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
+                    # Give the image a fixed-size box, so rows keep their height
+                    # when a thumbnail of another shape is loaded or evicted
+                    image_box = ttk.Frame(img_frame, width=target_size, height=target_size)
+                    image_box.pack_propagate(False)
+                    image_box.pack(pady=5)
                     
                     # Create label for image with cursor change on hover
-                    label = ttk.Label(img_frame, image=photo, cursor="hand2")
-                    label.image = photo  # Keep a reference!
-                    label.pack(pady=5)
+                    label = ttk.Label(image_box, image=self._blank_photo, cursor="hand2")
+                    label.image = self._blank_photo  # Keep a reference!
+                    label.pack(expand=True)
+                    self._tile_rows[-1][1].append(img_path)
+                    self._tile_labels[img_path] = label
                     
                     # Bind click event to open the image
                     label.bind('<Button-1>', lambda e, path=img_path: self.open_image(path))
@@ -1097,6 +1706,102 @@ class DICOMExtractorApp:
         # Update the canvas scroll region
         self.canvas.update_idletasks()
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._render_visible_tiles()
+    
+    def _on_canvas_yscroll(self, first, last):
+        """Update the scrollbar and render the tiles that scrolled into view"""
+        self.scrollbar_y.set(first, last)
+        if self._tile_rows and self._tile_render_id is None:
+            self._tile_render_id = self.root.after_idle(self._render_visible_tiles)
+    
+    def _render_visible_tiles(self):
+        """Show thumbnails in the tiles within a row of the visible canvas area"""
+        self._tile_render_id = None
+        if not self._tile_rows:
+            return
+        
+        target_size = self._thumbnail_size
+        try:
+            top = self.canvas.canvasy(0) - target_size
+            bottom = self.canvas.canvasy(self.canvas.winfo_height()) + target_size
+            frame_top = self.scrollable_frame.winfo_rooty()
+            
+            # Rows are laid out top to bottom, so stop at the first one below the view
+            visible = []
+            for row_frame, paths in self._tile_rows:
+                row_top = row_frame.winfo_rooty() - frame_top
+                if row_top >= bottom:
+                    break
+                if row_top + row_frame.winfo_height() > top:
+                    visible.extend(paths)
+        except tk.TclError:
+            return  # The tiles were destroyed before this ran
+        
+        self._load_thumbnails([p for p in visible if p not in self._failed_thumbs], target_size)
+        for img_path in visible:
+            key = (img_path, target_size)
+            photo = self._thumbnail_cache.pop(key, None)
+            if photo is None:
+                continue
+            self._thumbnail_cache[key] = photo  # Mark as most recently used
+            
+            label = self._tile_labels[img_path]
+            if label.image is not photo:
+                label.configure(image=photo)
+                label.image = photo
+        
+        # Drop the least recently shown thumbnails, never the ones in view
+        limit = max(THUMBNAIL_CACHE_SIZE, len(visible))
+        while len(self._thumbnail_cache) > limit:
+            key = next(iter(self._thumbnail_cache))
+            photo = self._thumbnail_cache.pop(key)
+            label = self._tile_labels.get(key[0])
+            if label is not None and label.image is photo:
+                label.configure(image=self._blank_photo)
+                label.image = self._blank_photo
+            self._recycle_photo(photo)
+    
+    def _recycle_photo(self, photo):
+        """Keep a PhotoImage no longer in the cache as a spare for _load_thumbnails"""
+        spares = self._photo_pool.setdefault(photo.pool_key, [])
+        if len(spares) < THUMBNAIL_CACHE_SIZE:
+            spares.append(photo)
+    
+    def _load_thumbnails(self, image_paths, target_size):
+        """Fill the thumbnail cache for image_paths, decoding missing ones in parallel"""
+        missing = [p for p in image_paths if (p, target_size) not in self._thumbnail_cache]
+        if not missing:
+            return
+        
+        # The cached thumbnails are THUMB_SIZE at most; larger tiles need the full image
+        use_thumbs = target_size <= THUMB_SIZE
+        
+        def load(img_path):
+            try:
+                source = self.current_thumb_paths.get(img_path, img_path) if use_thumbs else img_path
+                return load_preview_image(source, target_size)
+            except Exception as e:
+                print(f"Error loading image {img_path}: {e}")
+                return None
+        
+        # OpenCV decode/resize release the GIL, so the loads overlap on threads;
+        # PhotoImage must still be created here on the Tk thread
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for img_path, img in zip(missing, executor.map(load, missing)):
+                if img is None:
+                    self._failed_thumbs.add(img_path)
+                    continue
+                
+                # Paste into a spare PhotoImage of the same mode and size if there is one
+                pool_key = (img.mode, img.size)
+                spares = self._photo_pool.get(pool_key)
+                if spares:
+                    photo = spares.pop()
+                    photo.paste(img)
+                else:
+                    photo = ImageTk.PhotoImage(img)
+                    photo.pool_key = pool_key
+                self._thumbnail_cache[(img_path, target_size)] = photo
     
     def process_zip(self, zip_path, current=0, total=1):
         try:
@@ -1113,22 +1818,28 @@ class DICOMExtractorApp:
                 "DICOM_Extracted", 
                 f"{os.path.splitext(os.path.basename(zip_path))[0]}_{timestamp}"
             )
-            os.makedirs(output_dir, exist_ok=True)
+            os.makedirs(os.path.join(output_dir, THUMB_DIR), exist_ok=True)  # Creates output_dir too
             
             # Create a temp directory for extraction
             import tempfile
             import shutil
             
-            temp_dir = tempfile.mkdtemp()
-            self.update_status(f"Extracting {os.path.basename(zip_path)}...", int((current / total) * 100))
+            temp_dir = None
+            self.update_status(f"Reading {os.path.basename(zip_path)}...", int((current / total) * 100))
             
             try:
-                # Extract the ZIP file
-                extract_zip(zip_path, temp_dir)
+                # Only a DICOMDIR study needs its files on disk, as its records
+                # reference the instances by path
+                with zipfile.ZipFile(zip_path, 'r') as zf:
+                    has_dicomdir = 'DICOMDIR' in zf.namelist()
+                if has_dicomdir:
+                    temp_dir = tempfile.mkdtemp()
+                    extract_dicom_from_zip(zip_path, temp_dir)
                 
                 # Check if this is a DICOM study with a DICOMDIR file
-                dicom_dir_path = os.path.join(temp_dir, 'DICOMDIR')
-                if os.path.exists(dicom_dir_path):
+                dicom_files = []
+                dicom_dir_path = os.path.join(temp_dir, 'DICOMDIR') if temp_dir else None
+                if dicom_dir_path and os.path.exists(dicom_dir_path):
                     try:
                         self.update_status("Found DICOM study directory, processing...", 
                                          int((current + 0.1) * 100 / total))
@@ -1146,35 +1857,16 @@ class DICOMExtractorApp:
                             except ImportError:
                                 raise ImportError("Could not find required DICOMDIR parsing modules")
 
-                        # Process DICOMDIR
-                        processed_count = 0
+                        # Collect the referenced instances; they are converted below on the
+                        # process pool together, like the files found by content
                         if use_fileset:
                             try:
                                 fileset = FileSet(dicom_dir_path)
-                                for patient in getattr(fileset, 'patients', []):
-                                    for study in getattr(patient, 'studies', []):
-                                        for series in getattr(study, 'series', []):
-                                            for instance in getattr(series, 'instances', []):
-                                                if hasattr(instance, 'filename') and os.path.exists(instance.filename):
-                                                    try:
-                                                        img, _ = process_dicom(instance.filename)
-                                                        if img is not None:
-                                                            filename = f"dicom_{len(self.image_paths) + 1}.png"
-                                                            output_path = os.path.join(output_dir, filename)
-                                                            img.save(output_path)
-                                                            self.image_paths.append(output_path)
-                                                            processed_count += 1
-                                                    except Exception as e:
-                                                        print(f"Error processing {instance.filename}: {e}")
-                                if processed_count > 0:
-                                    self.update_status(f"Processed {processed_count} DICOM files from DICOMDIR",
-                                                     int((current + 0.9) * 100 / total))
-                                    return
+                                dicom_files = [instance.path for instance in fileset
+                                               if os.path.exists(instance.path)]
                             except Exception as e:
                                 print(f"Error processing DICOMDIR with FileSet: {e}")
-                        
-                        # If FileSet approach failed, try the old approach
-                        if processed_count == 0 and not use_fileset:
+                        else:
                             try:
                                 dicomdir = read_dicomdir(dicom_dir_path)
                                 base_dir = os.path.dirname(dicom_dir_path)
@@ -1185,60 +1877,50 @@ class DICOMExtractorApp:
                                                 if hasattr(instance, 'ReferencedFileID') and instance.ReferencedFileID:
                                                     file_path = os.path.join(base_dir, *instance.ReferencedFileID)
                                                     if os.path.exists(file_path):
-                                                        try:
-                                                            img, _ = process_dicom(file_path)
-                                                            if img is not None:
-                                                                filename = f"dicom_{len(self.image_paths) + 1}.png"
-                                                                output_path = os.path.join(output_dir, filename)
-                                                                img.save(output_path)
-                                                                self.image_paths.append(output_path)
-                                                                processed_count += 1
-                                                        except Exception as e:
-                                                            print(f"Error processing {file_path}: {e}")
-                                if processed_count > 0:
-                                    self.update_status(f"Processed {processed_count} DICOM files from DICOMDIR",
-                                                     int((current + 0.9) * 100 / total))
-                                    return
+                                                        dicom_files.append(file_path)
                             except Exception as e:
                                 print(f"Error processing DICOMDIR with read_dicomdir: {e}")
                     except Exception as e:
                         print(f"Error processing DICOMDIR: {e}")
-
-                # If DICOMDIR processing didn't work or wasn't found, try finding DICOM files by content
-                dicom_files = find_dicom_files(temp_dir)
                 
-                # If no DICOM files found by content, try to process all files that might be DICOM
-                if not dicom_files:
-                    self.update_status("No DICOM files found by signature, trying to process all files...",
-                                     int((current + 0.2) * 100 / total))
+                # Instances found through DICOMDIR are on disk; anything else is
+                # read straight from the archive
+                source_zip = None if dicom_files else zip_path
+                
+                # If DICOMDIR processing didn't work or wasn't found, read the members
+                # found by content straight from the archive
+                with zipfile.ZipFile(zip_path, 'r') as zf:
+                    # Skip DICOMDIR as we already tried that, and very small files
+                    # that can't be DICOM (the DICOM header is 132 bytes)
+                    all_files = candidate_members(zf)
+                    if not dicom_files:
+                        dicom_files = list_dicom_members(zf, all_files)
                     
-                    # Get all files in the extracted directory
-                    all_files = []
-                    for root, _, files in os.walk(temp_dir):
-                        for file in files:
-                            # Skip DICOMDIR as we already tried that
-                            if file.upper() == 'DICOMDIR':
+                    # If no DICOM files found by content, try to process all files that might be DICOM
+                    if not dicom_files:
+                        self.update_status("No DICOM files found by signature, trying to process all files...",
+                                         int((current + 0.2) * 100 / total))
+                        
+                        # Try to process each member as DICOM
+                        for info in all_files:
+                            try:
+                                # Skip members that can't be a bare DICOM data set without decompressing them
+                                if not is_raw_dicom_content(read_zip_member_head(zf, info, 2)):
+                                    continue
+                                
+                                # Parse only up to the pixel data, streaming from the archive and
+                                # leaving large values unread; an image data set always carries Rows
+                                with zf.open(info) as f:
+                                    ds = pydicom.dcmread(f, force=True, stop_before_pixels=True,
+                                                         specific_tags=['Rows'], defer_size='1 KB')
+                                if 'Rows' in ds:
+                                    dicom_files.append(info.filename)
+                            except:
                                 continue
-                            file_path = os.path.join(root, file)
-                            # Skip very small files that can't be DICOM
-                            if os.path.getsize(file_path) > 132:  # DICOM header is 132 bytes
-                                all_files.append(file_path)
-                    
-                    # Try to process each file as DICOM
-                    for file_path in all_files:
-                        try:
-                            # Try to read as DICOM
-                            ds = pydicom.dcmread(file_path, force=True)
-                            if hasattr(ds, 'pixel_array'):  # If it has pixel data, it's likely a valid DICOM
-                                dicom_files.append(file_path)
-                        except:
-                            continue
                 
                 if not dicom_files:
                     raise Exception("No valid DICOM files found in the ZIP archive")
                 
-                os.makedirs(output_dir, exist_ok=True)
-                
                 self.update_status(f"Processing {len(dicom_files)} DICOM files from {os.path.basename(zip_path)}...",
                                  int((current + 0.2) * 100 / total))
                 
@@ -1246,39 +1928,17 @@ class DICOMExtractorApp:
                 total_files = len(dicom_files)
                 self.image_paths = []
                 
-                for i, dicom_file in enumerate(dicom_files, 1):
+                # Decode and save on a process pool; pydicom's pixel handling is GIL-bound
+                jobs = list(enumerate(dicom_files, 1))
+                for i, dicom_file, output_path in self._convert_in_pool(jobs, output_dir, source_zip):
                     # Calculate overall progress (20-100% of this file's progress)
                     file_progress = (i / total_files) * 0.8 + 0.2  # 0.2 to 1.0
                     overall_progress = int((current + file_progress) * 100 / total)
                     self.update_status(f"Processing {i}/{total_files} from {os.path.basename(zip_path)}", 
                                      min(overall_progress, 100))
                     
-                    try:
-                        # Process the DICOM file
-                        image_data, ds = process_dicom(dicom_file)
-                        if image_data is not None:
-                            # Create a descriptive filename
-                            study_date = getattr(ds, 'StudyDate', 'unknown_date')
-                            sop_instance_uid = getattr(ds, 'SOPInstanceUID', str(i))
-                            output_filename = f"{study_date}_{sop_instance_uid}.png"
-                            output_path = os.path.join(output_dir, output_filename)
-                            
-                            # Save the image using PIL if OpenCV is not available
-                            if OPENCV_AVAILABLE:
-                                cv2.imwrite(output_path, image_data)
-                            else:
-                                # Convert numpy array to PIL Image and save
-                                if len(image_data.shape) == 2:  # Grayscale
-                                    img = Image.fromarray(image_data)
-                                else:  # Color
-                                    img = Image.fromarray(cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB) if OPENCV_AVAILABLE else image_data)
-                                img.save(output_path)
-                                
-                            self.image_paths.append(output_path)
-                            
-                    except Exception as e:
-                        print(f"Error processing {dicom_file}: {e}")
-                        continue
+                    if output_path is not None:
+                        self.image_paths.append(output_path)
                 
                 # Show previews after processing all files
                 if hasattr(self, 'image_paths') and self.image_paths:
@@ -1288,20 +1948,39 @@ class DICOMExtractorApp:
                 return output_dir
                 
             finally:
-                # Clean up temp directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                # Clean up temp directory in the background so the next ZIP starts right away
+                if temp_dir:
+                    cleanup = threading.Thread(target=shutil.rmtree, args=(temp_dir,),
+                                               kwargs={'ignore_errors': True}, daemon=True)
+                    cleanup.start()
+                    self._cleanup_threads = [t for t in self._cleanup_threads if t.is_alive()]
+                    self._cleanup_threads.append(cleanup)
                 
         except Exception as e:
             self.update_status(f"Error: {str(e)}")
             messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
             return None
     
+    def cancel_processing(self):
+        """Drop the conversions still queued when the window is closed mid-batch"""
+        pool = self._convert_pool
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def wait_for_cleanup(self, timeout=5):
+        """Give pending temp-dir deletions up to timeout seconds each to finish"""
+        for cleanup in self._cleanup_threads:
+            cleanup.join(timeout=timeout)
+        self._cleanup_threads = []
+    
     # Removed process_dicom_folder_with_progress as it's no longer needed
 
 def main():
     # Check for required packages
     try:
-        import pydicom
+        # Look pydicom up without importing it; that happens on first use
+        if importlib.util.find_spec('pydicom') is None:
+            raise ImportError("No module named 'pydicom'")
         import numpy
         from PIL import Image, ImageTk, ImageOps
         import tkinter as tk
@@ -1322,10 +2001,8 @@ def main():
                 messagebox.showinfo("Success", "Drag and drop support has been installed.\nPlease restart the application.")
                 sys.exit(0)
         
-        # Check for OpenCV
-        try:
-            import cv2
-        except ImportError:
+        # Check for OpenCV (installed at all; importing it is left for first use)
+        if importlib.util.find_spec('cv2') is None:
             if messagebox.askyesno(
                 "OpenCV Not Found",
                 "OpenCV is not installed. The application will use PIL for image processing, "
@@ -1361,7 +2038,10 @@ def main():
                     "install", 
                     "pydicom", 
                     "numpy", 
-                    "Pillow"
+                    "Pillow",
+                    "pylibjpeg",
+                    "pylibjpeg-libjpeg",
+                    "pylibjpeg-openjpeg"
                 ])
                 messagebox.showinfo(
                     "Installation Complete", 
@@ -1455,6 +2135,12 @@ def main():
     
     # Start the main loop
     root.mainloop()
+    
+    # Stop converting files nobody is waiting for any more
+    app.cancel_processing()
+    
+    # Let temp directories still being deleted in the background finish
+    app.wait_for_cleanup()
 
 if __name__ == "__main__":
     main()